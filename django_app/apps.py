@@ -1,6 +1,8 @@
 from django.apps import AppConfig
+from logging.handlers import QueueHandler, QueueListener
 import logging
 import atexit
+import queue
 
 
 class DjangoAppConfig(AppConfig):
@@ -8,10 +10,31 @@ class DjangoAppConfig(AppConfig):
     name = 'django_app'
 
     def ready(self):
+        from . import signals  # noqa: F401
+
         logger = logging.getLogger('django_app')
+        listener = self._start_queue_listener(logger)
         logger.info("Server started successfully")
 
         def on_shutdown():
             logger.info("Stopping server")
+            if listener is not None:
+                listener.stop()
 
         atexit.register(on_shutdown)
+
+    @staticmethod
+    def _start_queue_listener(logger):
+        """Move the logger's handlers behind a queue so request threads don't block on I/O"""
+        handlers = [h for h in logger.handlers if not isinstance(h, QueueHandler)]
+        if not handlers or len(handlers) != len(logger.handlers):
+            return None
+
+        log_queue = queue.Queue(-1)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        return listener
@@ -0,0 +1,66 @@
+import logging
+import json
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders a record's ``payload`` extra as JSON in place of its message"""
+
+    def format(self, record):
+        payload = getattr(record, 'payload', None)
+        if payload is None:
+            return super().format(record)
+
+        record.message = _dumps(payload)
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self.formatMessage(record)
+
+
+class MsgpackFormatter(logging.Formatter):
+    """Formatter that packs a record, including its ``payload`` extra, into a MessagePack frame"""
+
+    def __init__(self, *args, **kwargs):
+        if msgpack is None:
+            raise ImportError("MsgpackFormatter requires the msgpack package")
+        super().__init__(*args, **kwargs)
+
+    def format(self, record):
+        frame = {
+            "level": record.levelname,
+            "name": record.name,
+            "created": record.created,
+            "message": record.getMessage(),
+        }
+        payload = getattr(record, 'payload', None)
+        if payload is not None:
+            frame["payload"] = payload
+        return msgpack.packb(frame)
+
+
+class MsgpackFileHandler(logging.FileHandler):
+    """File handler that appends the binary frames produced by MsgpackFormatter"""
+
+    def __init__(self, filename, delay=False):
+        super().__init__(filename, mode='ab', delay=delay)
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record))
+            self.flush()
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,113 @@
+import logging
+import time
+from django.core.exceptions import DisallowedHost
+
+logger = logging.getLogger('django_app')
+
+# Non-HTTP_ META keys that are still request headers
+_EXTRA_META = frozenset(('CONTENT_TYPE', 'CONTENT_LENGTH'))
+
+# Request headers logged for successful responses
+_LOG_HEADERS = ('HTTP_USER_AGENT', 'HTTP_ACCEPT', 'HTTP_REFERER', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+
+# Error response bodies are logged up to this many bytes
+_MAX_LOGGED_BODY = 4096
+
+
+class LoggingMiddleware:
+    """Log method, URL, sizes, status and timing of every request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Skip timing entirely when request logging is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return self.get_response(request)
+
+        start_time = time.perf_counter_ns()
+        response = self.get_response(request)
+        log_request_response(request, response, start_time)
+        return response
+
+
+def log_request_response(request, response, start_time):
+    """Helper function to log request and response details; callers check the log level"""
+    try:
+        log_data = _build_log_data(request, response, start_time)
+    except Exception:
+        logger.exception("Failed to build request log entry")
+        return
+
+    # Serialized by JsonFormatter on the log listener thread
+    logger.info("request", extra={'payload': log_data})
+
+
+def _build_log_data(request, response, start_time):
+    """Collect request and response details into a log entry"""
+    duration_us = (time.perf_counter_ns() - start_time) // 1000  # Convert to microseconds
+
+    status = response.status_code
+    failed = status >= 400
+
+    # Get request headers: all of them for failed requests, a short whitelist otherwise
+    meta = request.META
+    if failed:
+        request_headers = {k: v for k, v in meta.items() if k[:5] == 'HTTP_' or k in _EXTRA_META}
+    else:
+        request_headers = {k: meta[k] for k in _LOG_HEADERS if k in meta}
+
+    # Get response headers
+    response_headers = dict(response.items())
+
+    # Get request body size from headers; only measure the body if the view already read it,
+    # so logging never buffers an unread upload into memory
+    try:
+        request_body_size = int(meta.get('CONTENT_LENGTH') or '')
+    except ValueError:
+        # Missing or malformed Content-Length. _body is Django's private cache of a body
+        # that has already been read; it is absent until then.
+        cached_body = getattr(request, '_body', None)
+        request_body_size = len(cached_body) if cached_body is not None else 0
+
+    # Streamed or not-yet-rendered template responses must not have .content touched
+    readable = not response.streaming and getattr(response, 'is_rendered', True)
+
+    # Get response body size, preferring Content-Length so the body is never consumed
+    content_length = response.get('Content-Length')
+    if content_length:
+        response_body_size = int(content_length)
+    elif readable:
+        response_body_size = len(response.content)
+    else:
+        response_body_size = -1
+
+    log_data = {
+        "method": request.method,
+        "url": f"{request.scheme}://{_request_host(request)}{request.get_full_path()}",
+        "request_headers": request_headers,
+        "request_body_size": request_body_size,
+        "response_status": status,
+        "response_headers": response_headers,
+        "response_body_size": response_body_size,
+        "processing_duration_us": duration_us,
+    }
+
+    # Log response body (truncated) if not successful
+    if failed and readable:
+        content = response.content
+        body = content[:_MAX_LOGGED_BODY].decode('utf-8', errors='replace')
+        if len(content) > _MAX_LOGGED_BODY:
+            body += '…(truncated)'
+        log_data["response_body"] = body
+
+    return log_data
+
+
+def _request_host(request):
+    """Return the request host, falling back to the raw header when it fails ALLOWED_HOSTS"""
+    try:
+        return request.get_host()
+    except DisallowedHost:
+        # Django already answered 400 for this request; log the host as sent
+        return request.META.get('HTTP_HOST', '')
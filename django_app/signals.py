@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Demo
+from .views import invalidate_demos
+
+
+@receiver(post_save, sender=Demo)
+@receiver(post_delete, sender=Demo)
+def invalidate_demos_cache(sender, **kwargs):
+    """Drop the cached home page listing whenever a Demo record changes"""
+    invalidate_demos()
@@ -1,75 +1,56 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
-from django.utils.decorators import method_decorator
-from django.views.decorators.http import require_http_methods
+from django.core.cache import cache
 from .models import Demo
-import logging
-import json
-import time
 
-logger = logging.getLogger('django_app')
+# Cached home page listing. Entries are keyed by a version that invalidation bumps,
+# so a listing queried before a write can never be cached as current after it.
+DEMOS_CACHE_KEY = 'home_demos'
+DEMOS_CACHE_VERSION_KEY = 'home_demos_version'
+DEMOS_CACHE_TIMEOUT = 30
 
 
-def log_request_response(request, response, start_time):
-    """Helper function to log request and response details"""
-    duration = (time.time() - start_time) * 1000  # Convert to milliseconds
+def get_demos():
+    """Return the demo records for the home page, served from cache when possible"""
+    version = cache.get_or_set(DEMOS_CACHE_VERSION_KEY, 1, None)
+    demos = cache.get(DEMOS_CACHE_KEY, version=version)
+    if demos is None:
+        demos = list(Demo.objects.order_by('-id').values('id', 'name', 'description'))
+        cache.set(DEMOS_CACHE_KEY, demos, DEMOS_CACHE_TIMEOUT, version=version)
+    return demos
 
-    # Get request headers
-    request_headers = dict(request.META.items())
-    request_headers = {k: v for k, v in request_headers.items() if k.startswith('HTTP_') or k in ['CONTENT_TYPE', 'CONTENT_LENGTH']}
 
-    # Get response headers
-    response_headers = dict(response.items()) if hasattr(response, 'items') else {}
-
-    # Get request body size (handle RawPostDataException for POST requests)
+def invalidate_demos():
+    """Retire the cached home page listing by moving to a new cache version"""
     try:
-        request_body_size = len(request.body) if hasattr(request, 'body') else 0
-    except Exception:
-        # If we can't access body (e.g., after POST data has been read), estimate from headers
-        request_body_size = int(request.META.get('CONTENT_LENGTH', 0))
-
-    # Get response body size
-    response_body_size = len(response.content) if hasattr(response, 'content') else 0
-
-    log_data = {
-        "method": request.method,
-        "url": request.build_absolute_uri(),
-        "request_headers": request_headers,
-        "request_body_size": request_body_size,
-        "response_status": response.status_code,
-        "response_headers": response_headers,
-        "response_body_size": response_body_size,
-        "processing_duration_ms": round(duration, 2)
-    }
-
-    # Log full response body if not successful
-    if response.status_code >= 400 and hasattr(response, 'content'):
-        log_data["response_body"] = response.content.decode('utf-8')
-
-    logger.info(json.dumps(log_data))
+        cache.incr(DEMOS_CACHE_VERSION_KEY)
+    except ValueError:
+        # Version key is missing (never set or evicted)
+        cache.set(DEMOS_CACHE_VERSION_KEY, 1, None)
 
 
 def home(request):
     """Main page view to display and add demo records"""
-    start_time = time.time()
-
     if request.method == 'POST':
-        name = request.POST.get('name', '').strip()
-        description = request.POST.get('description', '').strip()
-
-        if name and description:
-            Demo.objects.create(name=name, description=description)
+        # Accept one or more name/description pairs; the form posts a single pair
+        names = [name.strip() for name in request.POST.getlist('name')]
+        descriptions = [description.strip() for description in request.POST.getlist('description')]
+
+        if names and len(names) == len(descriptions) and all(names) and all(descriptions):
+            Demo.objects.bulk_create([
+                Demo(name=name, description=description)
+                for name, description in zip(names, descriptions)
+            ])
+            # bulk_create() does not send post_save, so invalidate the listing here
+            invalidate_demos()
             response = redirect('home')
         else:
-            demos = Demo.objects.all().order_by('-id')
+            demos = get_demos()
             response = render(request, 'django_app/home.html', {
                 'demos': demos,
                 'error': 'Both name and description are required.'
             })
     else:
-        demos = Demo.objects.all().order_by('-id')
+        demos = get_demos()
         response = render(request, 'django_app/home.html', {'demos': demos})
 
-    log_request_response(request, response, start_time)
     return response
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'django_app.middleware.LoggingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -79,6 +80,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# LocMemCache is per-process: invalidating the home page listing only reaches the
+# process that handled the write. That is fine for the single-process runserver
+# deploy; switch to a shared backend (Redis, Memcached) before running several workers.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -129,6 +143,7 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'json': {
+            '()': 'django_app.log_format.JsonFormatter',
             'format': '%(levelname)s %(asctime)s %(name)s %(message)s',
         },
     },
@@ -148,3 +163,13 @@ LOGGING = {
         },
     },
 }
+
+# Write MessagePack frames instead of JSON lines when logs feed a pipeline (requires msgpack)
+if os.environ.get('SERVER_LOG_FORMAT') == 'msgpack':
+    LOGGING['formatters']['msgpack'] = {
+        '()': 'django_app.log_format.MsgpackFormatter',
+    }
+    LOGGING['handlers']['file'].update({
+        'class': 'django_app.log_format.MsgpackFileHandler',
+        'formatter': 'msgpack',
+    })
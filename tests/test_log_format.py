@@ -0,0 +1,107 @@
+import pytest
+import json
+import logging
+import os
+import tempfile
+from django.test import TestCase
+from django_app.log_format import JsonFormatter, MsgpackFileHandler, MsgpackFormatter, msgpack
+
+
+class TestJsonFormatter(TestCase):
+
+    def make_record(self, msg, **extra):
+        record = logging.LogRecord('django_app', logging.INFO, __file__, 1, msg, None, None)
+        record.__dict__.update(extra)
+        return record
+
+    @pytest.mark.timeout(30)
+    def test_format_payload(self):
+        """
+        Test kind: unit_tests
+        Original method: JsonFormatter.format
+        """
+        formatter = JsonFormatter('%(levelname)s %(name)s %(message)s')
+        record = self.make_record('request', payload={'method': 'GET', 'response_status': 200})
+
+        output = formatter.format(record)
+
+        # The payload replaces the message and is valid JSON
+        prefix = 'INFO django_app '
+        self.assertTrue(output.startswith(prefix))
+        self.assertEqual(json.loads(output[len(prefix):]), {'method': 'GET', 'response_status': 200})
+
+    @pytest.mark.timeout(30)
+    def test_format_plain_message(self):
+        """
+        Test kind: unit_tests
+        Original method: JsonFormatter.format
+        """
+        formatter = JsonFormatter('%(levelname)s %(name)s %(message)s')
+        record = self.make_record('Server started successfully')
+
+        # Records without a payload are formatted as usual
+        self.assertEqual(formatter.format(record), 'INFO django_app Server started successfully')
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+class TestMsgpackFormatter(TestCase):
+
+    @pytest.mark.timeout(30)
+    def test_format_payload(self):
+        """
+        Test kind: unit_tests
+        Original method: MsgpackFormatter.format
+        """
+        formatter = MsgpackFormatter()
+        record = logging.LogRecord('django_app', logging.INFO, __file__, 1, 'request', None, None)
+        record.payload = {'method': 'GET', 'response_status': 200}
+
+        # The payload round-trips through MessagePack inside the record envelope
+        unpacked = msgpack.unpackb(formatter.format(record))
+        self.assertEqual(unpacked['payload'], {'method': 'GET', 'response_status': 200})
+        self.assertEqual(unpacked['level'], 'INFO')
+        self.assertEqual(unpacked['name'], 'django_app')
+        self.assertEqual(unpacked['created'], record.created)
+
+    @pytest.mark.timeout(30)
+    def test_format_plain_message(self):
+        """
+        Test kind: unit_tests
+        Original method: MsgpackFormatter.format
+        """
+        formatter = MsgpackFormatter()
+        record = logging.LogRecord('django_app', logging.INFO, __file__, 1, 'Server started successfully', None, None)
+
+        # Records without a payload are packed from their basic fields
+        unpacked = msgpack.unpackb(formatter.format(record))
+        self.assertEqual(unpacked['level'], 'INFO')
+        self.assertEqual(unpacked['message'], 'Server started successfully')
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+class TestMsgpackFileHandler(TestCase):
+
+    @pytest.mark.timeout(30)
+    def test_emit_round_trip(self):
+        """
+        Test kind: unit_tests
+        Original method: MsgpackFileHandler.emit
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'server.log')
+            handler = MsgpackFileHandler(filename)
+            handler.setFormatter(MsgpackFormatter())
+
+            started = logging.LogRecord('django_app', logging.INFO, __file__, 1, 'Server started successfully', None, None)
+            request = logging.LogRecord('django_app', logging.INFO, __file__, 1, 'request', None, None)
+            request.payload = {'method': 'GET', 'response_status': 200}
+            handler.emit(started)
+            handler.emit(request)
+            handler.close()
+
+            # Frames are appended back to back and decode as a stream
+            with open(filename, 'rb') as f:
+                frames = list(msgpack.Unpacker(f))
+
+        self.assertEqual([frame['message'] for frame in frames], ['Server started successfully', 'request'])
+        self.assertEqual(frames[1]['payload'], {'method': 'GET', 'response_status': 200})
@@ -0,0 +1,277 @@
+import pytest
+import time
+from unittest.mock import Mock, patch
+from django.test import TestCase, Client
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.urls import reverse
+from django_app.middleware import log_request_response
+
+
+class TestLoggingMiddleware(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def make_request(self, method='GET', path='/test', meta=None):
+        request = Mock(spec=HttpRequest)
+        request.method = method
+        request.scheme = 'http'
+        request.get_host.return_value = 'example.com'
+        request.get_full_path.return_value = path
+        request.META = meta if meta is not None else {}
+        return request
+
+    def make_response(self, status_code=200, content=b'', content_length=None, spec=HttpResponse):
+        response = Mock(spec=spec)
+        response.status_code = status_code
+        response.streaming = False
+        response.get.return_value = content_length
+        response.content = content
+        response.items.return_value = []
+        return response
+
+    def log_payload(self, request, response, start_time=None):
+        """Run log_request_response and return the single payload it logged"""
+        if start_time is None:
+            start_time = time.perf_counter_ns()
+        with patch('django_app.middleware.logger') as mock_logger:
+            log_request_response(request, response, start_time)
+
+            mock_logger.exception.assert_not_called()
+            mock_logger.info.assert_called_once()
+            return mock_logger.info.call_args[1]['extra']['payload']
+
+    @pytest.mark.timeout(30)
+    def test_call_logs_request(self):
+        """
+        Test kind: endpoint_tests
+        Original method: LoggingMiddleware.__call__
+        """
+        with patch('django_app.middleware.logger') as mock_logger:
+            response = self.client.get(reverse('home'), HTTP_USER_AGENT='TestAgent')
+            self.assertEqual(response.status_code, 200)
+
+            # Exactly one entry is logged per request
+            mock_logger.info.assert_called_once()
+            logged_data = mock_logger.info.call_args[1]['extra']['payload']
+
+            self.assertEqual(logged_data['method'], 'GET')
+            self.assertEqual(logged_data['url'], 'http://testserver/')
+            self.assertEqual(logged_data['response_status'], 200)
+            self.assertEqual(logged_data['request_headers']['HTTP_USER_AGENT'], 'TestAgent')
+
+    @pytest.mark.timeout(30)
+    def test_call_logs_disallowed_host(self):
+        """
+        Test kind: endpoint_tests
+        Original method: LoggingMiddleware.__call__
+        """
+        with patch('django_app.middleware.logger') as mock_logger:
+            response = self.client.get(reverse('home'), HTTP_HOST='evil.example')
+            self.assertEqual(response.status_code, 400)
+
+            # The rejected request is still logged as an entry, not a traceback
+            mock_logger.exception.assert_not_called()
+            mock_logger.info.assert_called_once()
+            logged_data = mock_logger.info.call_args[1]['extra']['payload']
+
+            self.assertEqual(logged_data['response_status'], 400)
+            self.assertEqual(logged_data['url'], 'http://evil.example/')
+
+    @pytest.mark.timeout(30)
+    def test_call_logging_disabled(self):
+        """
+        Test kind: endpoint_tests
+        Original method: LoggingMiddleware.__call__
+        """
+        with patch('django_app.middleware.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+
+            response = self.client.get(reverse('home'))
+            self.assertEqual(response.status_code, 200)
+            mock_logger.info.assert_not_called()
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        request = self.make_request(meta={
+            'HTTP_USER_AGENT': 'TestAgent',
+            'HTTP_ACCEPT': 'text/html',
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': '100',
+            'SERVER_NAME': 'testserver'
+        })
+        response = self.make_response(content=b'test response')
+        response.items.return_value = [('Content-Type', 'text/html')]
+
+        # Mock time
+        now = time.perf_counter_ns()
+        start_time = now - 100_000_000  # 100ms ago
+
+        with patch('django_app.middleware.time.perf_counter_ns', return_value=now):
+            logged_data = self.log_payload(request, response, start_time)
+
+        # Verify logged data structure
+        self.assertEqual(logged_data['method'], 'GET')
+        self.assertEqual(logged_data['url'], 'http://example.com/test')
+        self.assertEqual(logged_data['response_status'], 200)
+        self.assertEqual(logged_data['request_body_size'], 100)  # from CONTENT_LENGTH
+        self.assertEqual(logged_data['response_headers'], {'Content-Type': 'text/html'})
+        self.assertEqual(logged_data['response_body_size'], 13)  # len(b'test response')
+        self.assertEqual(logged_data['processing_duration_us'], 100_000)
+
+        # Verify request headers filtering
+        expected_headers = {
+            'HTTP_USER_AGENT': 'TestAgent',
+            'HTTP_ACCEPT': 'text/html',
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': '100'
+        }
+        self.assertEqual(logged_data['request_headers'], expected_headers)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_error_headers(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Request with a header outside the success whitelist
+        request = self.make_request(path='/missing', meta={
+            'HTTP_USER_AGENT': 'TestAgent',
+            'HTTP_X_REQUEST_ID': 'abc123',
+            'SERVER_NAME': 'testserver'
+        })
+        response = self.make_response(status_code=404, content=b'Not Found')
+
+        logged_data = self.log_payload(request, response)
+
+        # Failed requests log every HTTP header
+        expected_headers = {
+            'HTTP_USER_AGENT': 'TestAgent',
+            'HTTP_X_REQUEST_ID': 'abc123'
+        }
+        self.assertEqual(logged_data['request_headers'], expected_headers)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_error(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        request = self.make_request(method='POST', path='/error', meta={'CONTENT_LENGTH': '50'})
+        response = self.make_response(status_code=400, content=b'Bad Request Error')
+
+        logged_data = self.log_payload(request, response)
+
+        # Verify error response body is logged
+        self.assertEqual(logged_data['response_status'], 400)
+        self.assertEqual(logged_data['response_body'], 'Bad Request Error')
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_error_truncated(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        request = self.make_request(path='/error')
+        response = self.make_response(status_code=500, content=b'x' * 10000)
+
+        logged_data = self.log_payload(request, response)
+
+        # Only the first 4 KiB of the body is logged
+        self.assertEqual(logged_data['response_body'], 'x' * 4096 + '…(truncated)')
+        self.assertEqual(logged_data['response_body_size'], 10000)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_bad_content_length(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        request = self.make_request(method='POST', meta={'CONTENT_LENGTH': 'abc'})
+        response = self.make_response(content=b'test response')
+
+        logged_data = self.log_payload(request, response)
+
+        # A bad Content-Length is treated as an unknown (unread) body, like Django does
+        self.assertEqual(logged_data['request_body_size'], 0)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_body_cached(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Request without CONTENT_LENGTH whose body the view already read
+        request = self.make_request(method='POST')
+        request._body = b'already read'
+
+        logged_data = self.log_payload(request, self.make_response())
+
+        # Verify the cached body is measured
+        self.assertEqual(logged_data['request_body_size'], 12)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_body_unread(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Request without CONTENT_LENGTH whose body was never read
+        request = self.make_request(method='POST', path='/missing')
+        response = self.make_response(status_code=404, content=b'Not Found')
+
+        logged_data = self.log_payload(request, response)
+
+        # The body is not read just to be measured
+        self.assertEqual(logged_data['request_body_size'], 0)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_streaming(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Streaming response without Content-Length; content must not be read
+        response = self.make_response(status_code=500, spec=StreamingHttpResponse)
+        response.streaming = True
+        del response.content
+
+        logged_data = self.log_payload(self.make_request(path='/download'), response)
+
+        self.assertEqual(logged_data['response_body_size'], -1)
+        self.assertNotIn('response_body', logged_data)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_unrendered(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Template response that has not been rendered yet
+        response = self.make_response(status_code=404, spec=SimpleTemplateResponse)
+        response.is_rendered = False
+        del response.content
+
+        logged_data = self.log_payload(self.make_request(path='/lazy'), response)
+
+        # Content is never accessed, so no rendering is forced
+        self.assertEqual(logged_data['response_body_size'], -1)
+        self.assertNotIn('response_body', logged_data)
+
+    @pytest.mark.timeout(30)
+    def test_log_request_response_content_length(self):
+        """
+        Test kind: unit_tests
+        Original method: log_request_response
+        """
+        # Response advertising its size via Content-Length
+        response = self.make_response(content=b'short', content_length='2048')
+
+        logged_data = self.log_payload(self.make_request(), response)
+
+        self.assertEqual(logged_data['response_body_size'], 2048)
@@ -1,18 +1,18 @@
 import pytest
-import json
-import time
-from unittest.mock import Mock, patch
+from django.core.cache import cache
 from django.test import TestCase, Client
-from django.http import HttpRequest, HttpResponse
 from django.urls import reverse
 from django_app.models import Demo
-from django_app.views import log_request_response
+from django_app.views import (
+    DEMOS_CACHE_KEY, DEMOS_CACHE_TIMEOUT, DEMOS_CACHE_VERSION_KEY, get_demos, invalidate_demos
+)
 
 
 class TestViews(TestCase):
 
     def setUp(self):
         self.client = Client()
+        cache.clear()
 
     @pytest.mark.timeout(30)
     def test_home_get(self):
@@ -48,6 +48,68 @@ class TestViews(TestCase):
         demo = Demo.objects.get(name='Test Demo')
         self.assertEqual(demo.description, 'Test Description')
 
+    @pytest.mark.timeout(30)
+    def test_home_post_multiple_records(self):
+        """
+        Test kind: endpoint_tests
+        Original method: home
+        """
+        # Test POST request with several name/description pairs
+        data = {
+            'name': ['First', 'Second'],
+            'description': ['First description', 'Second description']
+        }
+        response = self.client.post(reverse('home'), data)
+
+        # Should redirect after successful creation
+        self.assertEqual(response.status_code, 302)
+
+        # Verify all demos were created
+        self.assertEqual(Demo.objects.get(name='First').description, 'First description')
+        self.assertEqual(Demo.objects.get(name='Second').description, 'Second description')
+
+        # Verify the cached listing was invalidated
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'Second description')
+
+    @pytest.mark.timeout(30)
+    def test_home_post_mismatched_records(self):
+        """
+        Test kind: endpoint_tests
+        Original method: home
+        """
+        # Test POST request with a description missing for one name
+        data = {
+            'name': ['First', 'Second'],
+            'description': ['First description']
+        }
+        response = self.client.post(reverse('home'), data)
+
+        # Should return form with error and create nothing
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Both name and description are required.')
+        self.assertEqual(Demo.objects.count(), 0)
+
+    @pytest.mark.timeout(30)
+    def test_home_get_cache_invalidated(self):
+        """
+        Test kind: endpoint_tests
+        Original method: home
+        """
+        # Prime the cached listing with no records
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'No demo records found.')
+
+        # Creating a record must invalidate the cached listing
+        self.client.post(reverse('home'), {'name': 'Cached Demo', 'description': 'Fresh'})
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, 'Cached Demo')
+
+        # Deleting it must invalidate the listing again
+        Demo.objects.all().delete()
+        response = self.client.get(reverse('home'))
+        self.assertNotContains(response, 'Cached Demo')
+
     @pytest.mark.timeout(30)
     def test_home_post_invalid_data(self):
         """
@@ -83,124 +145,29 @@ class TestViews(TestCase):
         self.assertEqual(Demo.objects.count(), 0)
 
     @pytest.mark.timeout(30)
-    def test_log_request_response(self):
-        """
-        Test kind: unit_tests
-        Original method: log_request_response
-        """
-        # Create mock request
-        request = Mock(spec=HttpRequest)
-        request.method = 'GET'
-        request.build_absolute_uri.return_value = 'http://example.com/test'
-        request.META = {
-            'HTTP_USER_AGENT': 'TestAgent',
-            'HTTP_ACCEPT': 'text/html',
-            'CONTENT_TYPE': 'application/json',
-            'CONTENT_LENGTH': '100',
-            'SERVER_NAME': 'testserver'
-        }
-        request.body = b'test body'
-
-        # Create mock response
-        response = Mock(spec=HttpResponse)
-        response.status_code = 200
-        response.content = b'test response'
-        response.items.return_value = [('Content-Type', 'text/html')]
-
-        # Mock logger and time
-        start_time = time.time() - 0.1  # 100ms ago
-
-        with patch('django_app.views.logger') as mock_logger, \
-             patch('django_app.views.time.time', return_value=time.time()):
-
-            log_request_response(request, response, start_time)
-
-            # Verify logger.info was called
-            mock_logger.info.assert_called_once()
-
-            # Parse the logged JSON
-            logged_data = json.loads(mock_logger.info.call_args[0][0])
-
-            # Verify logged data structure
-            self.assertEqual(logged_data['method'], 'GET')
-            self.assertEqual(logged_data['url'], 'http://example.com/test')
-            self.assertEqual(logged_data['response_status'], 200)
-            self.assertEqual(logged_data['request_body_size'], 9)  # len(b'test body')
-            self.assertEqual(logged_data['response_body_size'], 13)  # len(b'test response')
-            self.assertGreater(logged_data['processing_duration_ms'], 0)
-
-            # Verify request headers filtering
-            expected_headers = {
-                'HTTP_USER_AGENT': 'TestAgent',
-                'HTTP_ACCEPT': 'text/html',
-                'CONTENT_TYPE': 'application/json',
-                'CONTENT_LENGTH': '100'
-            }
-            self.assertEqual(logged_data['request_headers'], expected_headers)
-
-    @pytest.mark.timeout(30)
-    def test_log_request_response_error(self):
+    def test_get_demos_stale_set_after_invalidation(self):
         """
         Test kind: unit_tests
-        Original method: log_request_response
+        Original method: get_demos
         """
-        # Create mock request
-        request = Mock(spec=HttpRequest)
-        request.method = 'POST'
-        request.build_absolute_uri.return_value = 'http://example.com/error'
-        request.META = {'CONTENT_LENGTH': '50'}
-        request.body = b''
-
-        # Create mock response with error status
-        response = Mock(spec=HttpResponse)
-        response.status_code = 400
-        response.content = b'Bad Request Error'
-        response.items.return_value = []
-
-        start_time = time.time()
+        # A reader picks up the current version and queries before a write lands
+        self.assertEqual(get_demos(), [])
+        version = cache.get(DEMOS_CACHE_VERSION_KEY)
 
-        with patch('django_app.views.logger') as mock_logger:
-            log_request_response(request, response, start_time)
+        Demo.objects.create(name='Late Demo', description='Written mid-read')
 
-            # Verify logger.info was called
-            mock_logger.info.assert_called_once()
+        # The slow reader now caches its stale listing under the old version
+        cache.set(DEMOS_CACHE_KEY, [], DEMOS_CACHE_TIMEOUT, version=version)
 
-            # Parse the logged JSON
-            logged_data = json.loads(mock_logger.info.call_args[0][0])
-
-            # Verify error response body is logged
-            self.assertEqual(logged_data['response_status'], 400)
-            self.assertEqual(logged_data['response_body'], 'Bad Request Error')
+        # The new record is still served
+        self.assertEqual([demo['name'] for demo in get_demos()], ['Late Demo'])
 
     @pytest.mark.timeout(30)
-    def test_log_request_response_body_exception(self):
+    def test_invalidate_demos_without_version(self):
         """
         Test kind: unit_tests
-        Original method: log_request_response
+        Original method: invalidate_demos
         """
-        # Create mock request that raises exception when accessing body
-        request = Mock(spec=HttpRequest)
-        request.method = 'POST'
-        request.build_absolute_uri.return_value = 'http://example.com/test'
-        request.META = {'CONTENT_LENGTH': '100'}
-        request.body.side_effect = Exception("Cannot access body")
-
-        # Create mock response
-        response = Mock(spec=HttpResponse)
-        response.status_code = 200
-        response.content = b'test response'
-        response.items.return_value = []
-
-        start_time = time.time()
-
-        with patch('django_app.views.logger') as mock_logger:
-            log_request_response(request, response, start_time)
-
-            # Verify logger.info was called
-            mock_logger.info.assert_called_once()
-
-            # Parse the logged JSON
-            logged_data = json.loads(mock_logger.info.call_args[0][0])
-
-            # Verify request body size falls back to CONTENT_LENGTH
-            self.assertEqual(logged_data['request_body_size'], 100)
\ No newline at end of file
+        # Invalidating before any listing was cached must not fail
+        invalidate_demos()
+        self.assertEqual(get_demos(), [])